@@ -2,16 +2,20 @@
 Class which provides a thread responsible for callbacks such that they do not block other calls
 to the data server.
 """
+import os
+import bisect
 import logging
 import threading
 import queue
 import time
-from multiprocessing.pool import ThreadPool
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import TimeoutExpired
 
+import numpy as np
 
 from ..util import name_generator
-from ..settings import CALLBACK_THREAD_COUNT
+from ..settings import CALLBACK_THREAD_COUNT, CALLBACK_MAX_PENDING
 
 logger = logging.getLogger(__name__)
 
@@ -37,14 +41,22 @@ class CallbackController:
     Controls the callback process to run independently and not block measurement threads.
     """
     def __init__(self) -> None:
-        self.queue = queue.Queue()
+        self.queue = queue.SimpleQueue()
 
-        # callbacks for adding data to a dataset
+        # callbacks for adding data to a dataset, stored as {path: ((callid, func), ...)}. The
+        # tuples are never modified but replaced when registering or removing a callback, such
+        # that dispatching can read them without taking the lock. The index from callid to path
+        # is only needed for registering and removing callbacks.
         self._dset_callbacks = {}
+        self._dset_callback_paths = {}
         self._dset_callback_lock = threading.Lock()
 
-        # callbacks for adding new elements below a group
+        # callbacks for adding new elements below a group, stored as {path: {callid: func}}
+        # together with the sorted list of these paths to look up the prefixes of a path. Group
+        # events are only queued when a dataset is created, so the lookup is not cached.
         self._grp_callbacks = {}
+        self._grp_callback_paths = {}
+        self._grp_paths = []
         self._grp_callback_lock = threading.Lock()
 
         self._thread = None
@@ -76,13 +88,14 @@ class CallbackController:
         # removing callbacks
         logger.debug('removing all dataset callbacks')
         with self._dset_callback_lock:
-            for key in self._dset_callbacks.copy():
-                self._dset_callbacks.pop(key)
+            self._dset_callbacks = {}
+            self._dset_callback_paths.clear()
 
         logger.debug('removing all group callbacks')
         with self._grp_callback_lock:
-            for key in self._grp_callbacks.copy():
-                self._grp_callbacks.pop()
+            self._grp_callbacks.clear()
+            self._grp_callback_paths.clear()
+            self._grp_paths.clear()
 
         # block until the thread is actually stopped
         self._thread.join()
@@ -91,32 +104,23 @@ class CallbackController:
     def _call_callback(self, path, data, is_group, t_queued):
         t_started = time.time()
         if is_group:
-            calls = []
-
             with self._grp_callback_lock:
-                for (callid, (callpath, func)) in self._grp_callbacks.copy().items():
-                    if path.startswith(callpath):
-                        calls.append((callid, func))
+                calls = tuple(
+                    call
+                    for callpath in self._group_prefixes(path)
+                    for call in self._grp_callbacks[callpath].items()
+                )
 
-            # call callbacks without locking the dictionary to improve performance
             for callid, func in calls:
                 try:
                     logger.debug('calling group callback "%s" for "%s"', callid, path)
                     func(path)
                 except (EOFError, TimeoutExpired):
                     logger.info('Can\'t connect to callback "%s", removing it.', callid)
-                    self._grp_callbacks.pop(callid)
+                    self.remove_callback(callid)
 
         else:
-            calls = []
-
-            with self._dset_callback_lock:
-                for (callid, (callpath, func)) in self._dset_callbacks.items():
-                    if callpath == path:
-                        calls.append((callid, func))
-
-            # call callbacks without locking the dictionary to improve performance
-            for callid, func in calls:
+            for callid, func in self._dset_callbacks.get(path, ()):
                 try:
                     logger.debug('calling callback "%s" for "%s"', callid, path)
                     func(data)
@@ -126,8 +130,38 @@ class CallbackController:
 
         return t_queued, t_started, time.time(), path, is_group
 
-    def _after_callback(self, args):
-        t_queued, t_started, t_ended, path, is_group = args
+    def _group_prefixes(self, path):
+        """
+        Return all paths with group callbacks which are a prefix of ``path``. Uses binary search
+        on the sorted list of paths, such that only candidates which can still be a prefix are
+        compared. ``self._grp_callback_lock`` has to be held by the caller.
+        """
+        paths = self._grp_paths
+        prefixes = []
+
+        # every prefix of path sorts before or equal to path
+        hi = bisect.bisect_right(paths, path)
+        while hi > 0:
+            callpath = paths[hi - 1]
+            if path.startswith(callpath):
+                prefixes.append(callpath)
+                # the remaining prefixes are shorter than callpath
+                bound = path[:len(callpath) - 1]
+            else:
+                # the remaining prefixes are at most as long as the part callpath and path share
+                bound = os.path.commonprefix((callpath, path))
+            hi = bisect.bisect_right(paths, bound, 0, hi - 1)
+
+        return prefixes
+
+    def _after_callback(self, pending, future):
+        pending.release()
+
+        try:
+            t_queued, t_started, t_ended, path, is_group = future.result()
+        except Exception:
+            logger.exception('callback failed')
+            return
 
         if t_started - t_queued > 5:
             logger.warning('callback waited %.6fs. This indicates that the Thread pool cannot'
@@ -142,23 +176,35 @@ class CallbackController:
         refresh_delay: float = 1,
     ):
         logger.info("callback thread started")
-        pool = ThreadPool(CALLBACK_THREAD_COUNT)
+        pool = ThreadPoolExecutor(CALLBACK_THREAD_COUNT, thread_name_prefix="callback")
+        # limits the amount of events submitted to the pool which have not been handled yet
+        pending = threading.BoundedSemaphore(CALLBACK_MAX_PENDING)
 
         while not stop_event.is_set():
 
             try:
-                args = self.queue.get(block=True, timeout=refresh_delay)
+                batch = [self.queue.get(block=True, timeout=refresh_delay)]
             except queue.Empty:
                 continue
-            else:
-                pool.apply_async(
-                    self._call_callback,
-                    args=[*args, time.time()],
-                    callback=self._after_callback
-                )
 
-        pool.close()
-        pool.join()
+            # take everything else which is already waiting, such that events for the same path
+            # are dispatched together
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            t_queued = time.time()
+            for args in self._merge_events(batch):
+                if not pending.acquire(timeout=0.01):
+                    logger.warning('too many pending callbacks, dropping event for "%s"', args[0])
+                    continue
+
+                future = pool.submit(self._call_callback, *args, t_queued)
+                future.add_done_callback(partial(self._after_callback, pending))
+
+        pool.shutdown(wait=True)
 
         logger.info("callback thread stopped")
 
@@ -166,6 +212,31 @@ class CallbackController:
         stop_event.clear()
 
 
+    @staticmethod
+    def _merge_events(batch):
+        """
+        Combine the events ``(path, data, is_group)`` in ``batch`` which have the same path and
+        type, keeping the order in which the paths appeared first. The data of dataset events is
+        concatenated, group events only need to be dispatched once.
+        """
+        merged = {}
+        for path, data, is_group in batch:
+            merged.setdefault((path, is_group), []).append(data)
+
+        events = []
+        for (path, is_group), datas in merged.items():
+            if is_group or len(datas) == 1:
+                events.append((path, datas[0], is_group))
+                continue
+
+            try:
+                events.append((path, np.concatenate(datas), is_group))
+            except (ValueError, TypeError):
+                # different dtypes or shapes, dispatch them one by one
+                events.extend((path, data, is_group) for data in datas)
+
+        return events
+
     def register_callback(
         self,
         path: str,
@@ -192,11 +263,16 @@ class CallbackController:
         if is_group:
             logger.info('registering callback "%s" for group: "%s"', callid, path)
             with self._grp_callback_lock:
-                self._grp_callbacks[callid] = (path, func)
+                if path not in self._grp_callbacks:
+                    self._grp_callbacks[path] = {}
+                    bisect.insort(self._grp_paths, path)
+                self._grp_callbacks[path][callid] = func
+                self._grp_callback_paths[callid] = path
         else:
             logger.info('registering callback "%s" for dataset: "%s"', callid , path)
             with self._dset_callback_lock:
-                self._dset_callbacks[callid] = (path, func)
+                self._dset_callbacks[path] = (*self._dset_callbacks.get(path, ()), (callid, func))
+                self._dset_callback_paths[callid] = path
 
         return callid
 
@@ -212,15 +288,25 @@ class CallbackController:
             if there exists no callback with ``id``
         """
         with self._dset_callback_lock:
-            if callid in self._dset_callbacks:
+            if callid in self._dset_callback_paths:
                 logger.info('removing callback "%s"', callid)
-                self._dset_callbacks.pop(callid)
+                path = self._dset_callback_paths.pop(callid)
+                calls = tuple(call for call in self._dset_callbacks[path] if call[0] != callid)
+                if calls:
+                    self._dset_callbacks[path] = calls
+                else:
+                    self._dset_callbacks.pop(path)
                 return
 
         with self._grp_callback_lock:
-            if callid in self._grp_callbacks:
+            if callid in self._grp_callback_paths:
                 logger.info('removing callback "%s"', callid)
-                self._grp_callbacks.pop(callid)
+                path = self._grp_callback_paths.pop(callid)
+                calls = self._grp_callbacks[path]
+                calls.pop(callid)
+                if not calls:
+                    self._grp_callbacks.pop(path)
+                    self._grp_paths.pop(bisect.bisect_left(self._grp_paths, path))
                 return
 
         logger.info('callback with id "%s" not found, skipping...', callid)
@@ -1,66 +1,239 @@
 """
 This file provides an interface around an hdf5 file provided by ``h5py.File``.
 """
+import os
 import time
 import queue
 import logging
 import threading
-from typing import Tuple, Union, Any
+from typing import Tuple, Union, Any, Dict, List
 
 import h5py
 import numpy as np
 
+from ..settings import (
+    HDF5_FLUSH_INTERVAL,
+    HDF5_BUFFER_SIZE,
+    HDF5_CHUNK_SIZE,
+    HDF5_CREATED_ON_STRING,
+    HDF5_PREALLOCATE_CHUNKS,
+    HDF5_CHUNK_CACHE_SIZE,
+    HDF5_CHUNK_CACHE_SLOTS,
+    HDF5_CHUNK_CACHE_W0,
+    HDF5_PAGE_SIZE,
+    HDF5_PAGE_BUFFER_SIZE,
+)
+
 logger = logging.getLogger(__name__)
 
+# number of locks of each kind of per-path lock, paths are distributed over them by their hash.
+# Needs to be a power of two.
+LOCK_STRIPES = 32
+
 class HDF5FileInterfaceError(Exception):
     """Exceptions concerning the HDF5FileInterface"""
 
+class _ValidAttributeManager(h5py.AttributeManager):
+    """Attributes of a dataset without the internal ``_valid_rows`` attribute."""
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __iter__(self):
+        for name in super().__iter__():
+            if name != "_valid_rows":
+                yield name
+
+    def __contains__(self, name):
+        return name != "_valid_rows" and super().__contains__(name)
+
+class ValidRowsDataset(h5py.Dataset):
+    """Dataset as returned by :meth:`HDF5FileInterface.get`, which only shows the rows which have
+    been written. Spare rows of a preallocated dataset are hidden from its shape and indexing,
+    the attribute tracking them is hidden from its attributes.
+
+    Parameters
+    ----------
+    dset : h5py.Dataset
+        the dataset to bind to
+    interface : HDF5FileInterface
+        the interface tracking the written rows
+    """
+
+    def __init__(self, dset, interface):
+        super().__init__(dset.id)
+        self._rows_name = dset.name
+        self._interface = interface
+
+    @property
+    def shape(self):
+        shape = super().shape
+        rows = self._interface._valid_rows.get(self._rows_name)
+        if rows is None:
+            return shape
+        return (rows,) + shape[1:]
+
+    def __getitem__(self, args, new_dtype=None):
+        if self._rows_name in self._interface._valid_rows:
+            args = args if isinstance(args, tuple) else (args,)
+            fields = tuple(arg for arg in args if isinstance(arg, str))
+            indices = tuple(arg for arg in args if not isinstance(arg, str))
+            indices = self._interface._valid_indices(self, indices)
+            args = fields + (indices if isinstance(indices, tuple) else (indices,))
+        return super().__getitem__(args, new_dtype)
+
+    @property
+    def attrs(self):
+        return _ValidAttributeManager(self)
+
 class HDF5FileInterface():
     """Wrapper around an ``h5py.File`` with some added functionality for convenience. The file will
     be open after this class is initialized.
 
+    Rows appended to an existing dataset are collected in a per-path buffer and written to the
+    file in one go, either once they fill a chunk of the dataset and at least
+    ``HDF5_BUFFER_SIZE`` bytes or after at most ``HDF5_FLUSH_INTERVAL`` seconds. Reading from a
+    dataset writes its buffered rows first. Buffered rows are only guaranteed to end up in the file
+    if :meth:`close` is called, either directly or by using the interface as context manager.
+
     Parameters
     ----------
     filename : str
         filename to use for storing the data
+    callback_queue : queue.SimpleQueue, optional
+        queue to put ``(path, arr, is_group)`` into for every change to the file
+    preallocate_chunks : int = HDF5_PREALLOCATE_CHUNKS
+        if larger than 0, datasets grow by this many chunks at once instead of row by row. The
+        rows which have been written are tracked and the spare rows are removed when the file
+        is closed. Datasets returned by :meth:`get` hide the spare rows.
+    rdcc_nbytes : int = HDF5_CHUNK_CACHE_SIZE
+        size in bytes of the chunk cache of each dataset
+    rdcc_nslots : int = HDF5_CHUNK_CACHE_SLOTS
+        number of slots in the hash table of the chunk cache
+    rdcc_w0 : float = HDF5_CHUNK_CACHE_W0
+        preemption policy of the chunk cache
     """
 
     def __init__(
         self,
         filename: str,
-        callback_queue: queue.Queue = None
+        callback_queue: queue.SimpleQueue = None,
+        preallocate_chunks: int = HDF5_PREALLOCATE_CHUNKS,
+        rdcc_nbytes: int = HDF5_CHUNK_CACHE_SIZE,
+        rdcc_nslots: int = HDF5_CHUNK_CACHE_SLOTS,
+        rdcc_w0: float = HDF5_CHUNK_CACHE_W0,
     ):
         logger.debug('filename "%s"', filename)
         self._filename = filename
         self._callback_queue = callback_queue
+        self._preallocate_chunks = preallocate_chunks
+        self._rdcc_nbytes = rdcc_nbytes
+        self._rdcc_nslots = rdcc_nslots
+        self._rdcc_w0 = rdcc_w0
 
         self._f = None
+        # guards opening and closing the file
         self._lock = threading.Lock()
+        # guard the creation of datasets, per path
+        self._create_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+        # rows which have not been written to the file yet, keyed by the name of the dataset such that
+        # different spellings of the same path share a buffer
+        self._buffers: Dict[str, List[np.ndarray]] = {}
+        self._buffer_rows: Dict[str, int] = {}
+        self._buffer_limits: Dict[str, int] = {}
+        # path given when the rows of a dataset were first buffered, used for the callbacks
+        self._callback_paths: Dict[str, str] = {}
+        self._buffer_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._write_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+        # amount of rows written to datasets which are larger than their content, together with
+        # the datasets whose ``_valid_rows`` attribute is behind
+        self._valid_rows: Dict[str, int] = {}
+        self._unsaved_rows = set()
+
+        # opened datasets, since looking up a path in the file is expensive
+        self._dsets: Dict[str, h5py.Dataset] = {}
+
+        self._flush_thread = None
+        self.FLUSH_STOP_EVENT = threading.Event()
 
         # open file
         self.open()
 
     def open(self):
-        """Open file in mode 'a'."""
-        if self._f:
-            raise HDF5FileInterfaceError("Can't open h5py.File because it is already open")
+        """Open file in mode 'a', or create it with paged allocation, and start the thread which
+        periodically flushes the row buffers."""
+        with self._lock:
+            if self._f:
+                raise HDF5FileInterfaceError("Can't open h5py.File because it is already open")
+
+            # the file space strategy can only be chosen when the file is created, the page
+            # buffer is only used by hdf5 if the file has been created with paged allocation
+            mode, kwargs = "a", {}
+            if HDF5_PAGE_SIZE > 0 and not os.path.exists(self._filename):
+                mode = "x"
+                kwargs.update(fs_strategy="page", fs_persist=True, fs_page_size=HDF5_PAGE_SIZE)
+            if HDF5_PAGE_SIZE > 0 and HDF5_PAGE_BUFFER_SIZE > 0:
+                kwargs.update(page_buf_size=HDF5_PAGE_BUFFER_SIZE)
+
+            logger.info('opening file "%s" in mode "%s"', self._filename, mode)
+            self._f = h5py.File(
+                self._filename,
+                mode,
+                libver="latest",
+                rdcc_nbytes=self._rdcc_nbytes,
+                rdcc_nslots=self._rdcc_nslots,
+                rdcc_w0=self._rdcc_w0,
+                **kwargs,
+            )
 
-        logger.info('opening file "%s" in mode "a"', self._filename)
-        self._f = h5py.File(self._filename, "a", libver="latest")
+            # remove spare rows left over if the file has not been closed properly
+            self._f.visititems(self._trim_dataset)
 
-    def close(self):
-        """Closes file the file and removes all callbacks."""
-        if not self._f:
-            raise HDF5FileInterfaceError("Can't close h5py.File because there is none open")
+            # daemon, such that a missing call to close does not keep the interpreter alive
+            self._flush_thread = threading.Thread(
+                target=self._flush_thread_func,
+                args=[self.FLUSH_STOP_EVENT],
+                daemon=True,
+            )
+            self._flush_thread.start()
 
-        logger.info('closing file "%s"', self._filename)
-        self._f.close()
-        self._f = None
+    def close(self):
+        """Writes all buffered rows and closes the file."""
+        with self._lock:
+            if not self._f:
+                raise HDF5FileInterfaceError("Can't close h5py.File because there is none open")
+
+            # block until the flush thread has stopped, then write what is left
+            self.FLUSH_STOP_EVENT.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+            self.FLUSH_STOP_EVENT.clear()
+            self.flush()
+            self._buffer_limits.clear()
+
+            # remove spare rows of preallocated datasets
+            for name in list(self._valid_rows):
+                self._trim_dataset(name, self._dataset(name))
+            self._dsets.clear()
+
+            logger.info('closing file "%s"', self._filename)
+            self._f.close()
+            self._f = None
+
+    def __enter__(self):
+        """Python context manager setup, the file is already open after initialization"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Python context manager teardown"""
+        self.close()
 
     def append(
         self,
         path: str,
-        arr: Union[np.ndarray, dict[str, list[Any]]],
+        arr: Union[np.ndarray, Dict[str, List[Any]]],
         **kwargs,
     ) -> None:
         """
@@ -69,7 +242,9 @@ class HDF5FileInterface():
         first axis being infinitely extendable. Does nothing if ``len(arr) == 0``.
 
         Any callback pointing to this path will be called and provided with the newly appended
-        data, but converted to a numpy structured array.
+        data, but converted to a numpy structured array. If the dataset already exists, the data
+        is buffered first and the callback receives it together with the other rows written in
+        the same flush.
 
         Parameters
         ----------
@@ -83,6 +258,7 @@ class HDF5FileInterface():
         Raises
         ------
         ValueError : if the secondary dimensions are not the same
+        ValueError : if the data can't be converted to the dtype of an existing dataset
 
         Examples
         --------
@@ -133,34 +309,238 @@ class HDF5FileInterface():
             return
 
         # need this lock so that if two threads want to access a dataset which has to be created
-        # do not both create it, raising a error
-        with self._lock:
+        # do not both create it, raising a error. Only threads appending to paths which share a
+        # lock stripe wait for each other.
+        with self._stripe(self._create_locks, '/' + path.strip('/')):
             try:
-                dset = self._f[path]
+                dset = self._dataset(path)
             except KeyError:
                 # dataset does not exist, create it
                 arr = self._convert_to_array(arr)
                 dset = self._create_dataset(path, arr)
+                self._dsets[path] = dset
+                created = True
             else:
-                # dataset exists, append to it
-                arr = self._convert_to_array(arr, dset.dtype)
+                created = False
 
-                logger.debug('appending data to "%s"', path)
-                dset.resize(dset.shape[0] + arr.shape[0], axis=0)
-                dset[-arr.shape[0]:] = arr
+            # set attributes under the same lock, such that concurrent appends to a new dataset
+            # do not race setting them
+            if kwargs:
+                logger.debug('attributes for "%s": %s', path, kwargs)
+                self._set_attributes(dset, kwargs)
 
-        # set attributes
-        for (key, value) in kwargs.items():
-            logger.debug('attribute for "%s", "%s" : %s', path, key, value)
-            dset.attrs[key] = value
+        if created:
+            if self._callback_queue:
+                self._callback_queue.put((path, arr, False))
+            return
 
-        # callbacks
-        if self._callback_queue:
-            self._callback_queue.put((path, arr, False))
+        # dataset exists, convert the rows before buffering them, such that errors are raised here
+        # and not when the buffer is written. Values are cast like when writing to the dataset
+        # directly. Arrays of the caller are copied, since they might be changed before the rows
+        # are written.
+        converted = self._convert_to_array(arr, dset.dtype)
+        if converted is arr:
+            arr = np.array(arr, dtype=dset.dtype)
+        else:
+            arr = np.asarray(converted, dtype=dset.dtype)
+        if arr.shape[1:] != dset.shape[1:]:
+            raise ValueError(
+                f'can\'t append data with shape {arr.shape} to dataset "{path}" with shape '
+                f'{dset.shape}'
+            )
+
+        name = dset.name
+        with self._stripe(self._buffer_locks, name):
+            self._buffers.setdefault(name, []).append(arr)
+            self._buffer_rows[name] = self._buffer_rows.get(name, 0) + arr.shape[0]
+            self._callback_paths.setdefault(name, path)
+
+            try:
+                limit = self._buffer_limits[name]
+            except KeyError:
+                limit = self._buffer_limit(dset)
+                self._buffer_limits[name] = limit
+
+            full = self._buffer_rows[name] >= limit
+
+        if full:
+            self._flush_path(name)
+
+    def append_many(
+        self,
+        data: Dict[str, Union[np.ndarray, Dict[str, List[Any]]]],
+    ) -> None:
+        """
+        Append to multiple datasets at once, in the same way as :meth:`append` for each item.
+        Use this to save a number of channels which are measured together with a single call,
+        e.g. to the data server.
+
+        Parameters
+        ----------
+        data : dict[str, Union[np.ndarray, dict[str, list[Any]]]]
+            the data to append, keyed by the path of the dataset
+        """
+        for path, arr in data.items():
+            self.append(path, arr)
+
+    def reserve(
+        self,
+        path: str,
+        rows: int,
+    ) -> None:
+        """
+        Make room for ``rows`` rows in the dataset at ``path``, such that it does not need to be
+        resized until that many rows have been appended. Use this if the length of a measurement
+        is known in advance. The spare rows are tracked in the same way as with
+        ``preallocate_chunks`` and removed when the file is closed.
+
+        Parameters
+        ----------
+        path : str
+            path of an existing dataset with an extendable first axis
+        rows : int
+            total amount of rows the dataset should have space for
+
+        Raises
+        ------
+        KeyError
+            if there exists no object at the path
+        """
+        dset = self._dataset(path)
+        with self._stripe(self._write_locks, dset.name):
+            if rows <= dset.shape[0]:
+                return
+
+            written = self._valid_rows.get(dset.name, dset.shape[0])
+            logger.debug('reserving %d rows for "%s" with %d rows', rows, path, written)
+            dset.resize(rows, axis=0)
+            self._set_valid_rows(dset, written)
+
+    def flush(
+        self,
+        path: str = None,
+    ):
+        """
+        Write buffered rows to the file.
+
+        Parameters
+        ----------
+        path : str, optional
+            only write the rows buffered for this path, by default all buffers are written
+        """
+        names = list(self._buffers) if path is None else [self._dataset(path).name]
+
+        for name in names:
+            self._flush_path(name)
+
+    def _flush_path(
+        self,
+        name: str,
+    ):
+        """
+        Write the rows buffered for the dataset ``name`` to the file and queue the callback. If
+        writing fails, the rows are put back in front of the buffer and the error is raised.
+
+        The buffer lock is only held while taking the rows out of the buffer, such that other
+        threads can keep appending while the rows are written to the file. The write lock makes
+        sure that the rows of one path are written in order and that a flush only returns after
+        any write to the path which is already in progress is done. Readers of a path without
+        buffered rows and without a write in progress therefore do not need to take the lock.
+        """
+        write_lock = self._stripe(self._write_locks, name)
+        if name not in self._buffers and not write_lock.locked():
+            return
+
+        buffer_lock = self._stripe(self._buffer_locks, name)
+        with write_lock:
+            with buffer_lock:
+                arrs = self._buffers.pop(name, None)
+                if not arrs:
+                    return
+                self._buffer_rows.pop(name)
+                path = self._callback_paths.pop(name)
+
+            arr = arrs[0] if len(arrs) == 1 else np.concatenate(arrs)
+
+            logger.debug('appending %d rows to "%s"', arr.shape[0], name)
+            try:
+                self._append_to_dataset(self._dataset(name), arr)
+            except Exception:
+                with buffer_lock:
+                    self._buffers[name] = [arr] + self._buffers.get(name, [])
+                    self._buffer_rows[name] = self._buffer_rows.get(name, 0) + arr.shape[0]
+                    self._callback_paths[name] = path
+                raise
+
+            # callbacks
+            if self._callback_queue:
+                self._callback_queue.put((path, arr, False))
+
+    def _buffer_limit(
+        self,
+        dset: h5py.Dataset,
+    ) -> int:
+        """Return the amount of rows to buffer for ``dset`` before they are written, which is at
+        least one chunk and ``HDF5_BUFFER_SIZE`` bytes."""
+        row_nbytes = dset.dtype.itemsize * int(np.prod(dset.shape[1:]))
+        return max(dset.chunks[0], HDF5_BUFFER_SIZE // row_nbytes)
+
+    def _dataset(
+        self,
+        path: str,
+    ):
+        """Return the object at ``path``, datasets are cached to avoid looking them up in the
+        file again."""
+        try:
+            return self._dsets[path]
+        except KeyError:
+            obj = self._f[path]
+
+        if isinstance(obj, h5py.Dataset):
+            self._dsets[path] = obj
+        return obj
+
+    @staticmethod
+    def _set_attributes(
+        obj: Union[h5py.Group, h5py.Dataset],
+        attrs: Dict[str, Any],
+    ):
+        """Set ``attrs`` on ``obj``. Numbers and numeric arrays are created with their numpy dtype,
+        which skips h5py guessing the type, other values such as strings are left to h5py."""
+        for key, value in attrs.items():
+            arr = np.asarray(value)
+            if arr.dtype.kind in "biufc":
+                obj.attrs.create(key, arr, dtype=arr.dtype)
+            else:
+                obj.attrs[key] = value
+
+    @staticmethod
+    def _stripe(
+        locks: List[threading.Lock],
+        path: str,
+    ) -> threading.Lock:
+        """Return the lock out of the striped ``locks`` which is responsible for ``path``."""
+        return locks[hash(path) & (LOCK_STRIPES - 1)]
+
+    def _flush_thread_func(
+        self,
+        stop_event: threading.Event,
+    ):
+        logger.info("flush thread started")
+
+        while not stop_event.wait(HDF5_FLUSH_INTERVAL):
+            try:
+                self.flush()
+                self._save_valid_rows()
+            except Exception:
+                # the rows stay buffered and are written with the next flush
+                logger.exception("failed to flush buffered rows")
+
+        logger.info("flush thread stopped")
 
     def _convert_to_array(
         self,
-        arr: Union[np.ndarray, dict[str, list[Any]]],
+        arr: Union[np.ndarray, Dict[str, List[Any]]],
         dtype = None
     ):
         """
@@ -193,18 +573,22 @@ class HDF5FileInterface():
                 else:
                     dtype = np.dtype([get_type(k, arr[k]) for k in arr.keys()])
 
-            # convert dict to compound type array, making sure to use the same tuple ordering
+            # convert dict to compound type array by filling it field by field, for lists only
+            # as many rows as the shortest list provides, in the same way ``zip`` would. A single
+            # row, given as scalars or lists of length one, is built from one tuple, which numpy
+            # converts in one call.
             try:
                 if val_type == list:
-                    arr = np.fromiter(
-                        zip(*[arr[k] for k in dtype.names]),
-                        dtype = dtype
-                    )
+                    length = min(len(arr[k]) for k in dtype.names)
+                    if length == 1:
+                        out = np.array([tuple([arr[k][0] for k in dtype.names])], dtype=dtype)
+                    else:
+                        out = np.empty(length, dtype=dtype)
+                        for k in dtype.names:
+                            out[k] = arr[k][:length]
                 else:
-                    arr = np.fromiter(
-                        zip(*[[arr[k]] for k in dtype.names]),
-                        dtype = dtype
-                    )
+                    out = np.array([tuple([arr[k] for k in dtype.names])], dtype=dtype)
+                arr = out
             except KeyError as error:
                 raise KeyError(f'Error when converting {arr} to dtype {dtype}, '
                     'likely due to mismatched keys in the dictionary and dtype') from error
@@ -214,12 +598,139 @@ class HDF5FileInterface():
 
         return arr
 
+    def _append_to_dataset(
+        self,
+        dset: h5py.Dataset,
+        arr: np.ndarray,
+    ):
+        """Extend ``dset`` along the first axis and write ``arr`` into the new rows.
+
+        If ``arr`` already has the dtype and secondary dimensions of the dataset, the data is
+        written with ``write_direct``, which hands the buffer to HDF5 in a single call and skips
+        the selection and conversion done by h5py's ``__setitem__``. Otherwise, the slower slice
+        assignment is used, which also raises the appropriate errors for mismatched data.
+
+        Parameters
+        ----------
+        dset : h5py.Dataset
+            the dataset to append to
+        arr : np.ndarray
+            the data to append
+        """
+        name = dset.name
+        start = self._valid_rows.get(name, dset.shape[0])
+        stop = start + arr.shape[0]
+
+        # only resize if the rows do not fit into the space which has been preallocated
+        resize = stop > dset.shape[0]
+        if resize:
+            dset.resize(stop + self._preallocate_chunks * dset.chunks[0], axis=0)
+
+        if arr.dtype == dset.dtype and arr.shape[1:] == dset.shape[1:]:
+            dset.write_direct(np.ascontiguousarray(arr), dest_sel=np.s_[start:stop])
+        else:
+            dset[start:stop] = arr
+
+        if resize:
+            if stop < dset.shape[0] or name in self._valid_rows:
+                self._set_valid_rows(dset, stop)
+        elif name in self._valid_rows:
+            # the attribute is updated by the flush thread, instead of for every write
+            self._valid_rows[name] = stop
+            self._unsaved_rows.add(name)
+
+    def _set_valid_rows(
+        self,
+        dset: h5py.Dataset,
+        rows: int,
+    ):
+        """Track that only the first ``rows`` rows of ``dset`` contain data. This is also saved
+        as the attribute ``_valid_rows``, such that the spare rows can be removed when the file is
+        opened again after it has not been closed properly."""
+        self._valid_rows[dset.name] = rows
+        self._unsaved_rows.discard(dset.name)
+        dset.attrs["_valid_rows"] = rows
+
+    def _save_valid_rows(self):
+        """Write the ``_valid_rows`` attribute of the datasets which have been appended to
+        without being resized."""
+        while self._unsaved_rows:
+            try:
+                name = self._unsaved_rows.pop()
+            except KeyError:
+                return
+
+            with self._stripe(self._write_locks, name):
+                rows = self._valid_rows.get(name)
+                if rows is not None:
+                    self._dataset(name).attrs["_valid_rows"] = rows
+
+    def _trim_dataset(
+        self,
+        name: str,
+        obj: Any,
+    ):
+        """Resize a preallocated dataset to the rows which have been written and remove the
+        ``_valid_rows`` attribute. Objects which are not preallocated datasets are skipped, such
+        that this can be used with ``h5py.Group.visititems``."""
+        if not isinstance(obj, h5py.Dataset) or "_valid_rows" not in obj.attrs:
+            return
+
+        # the attribute might be behind the rows tracked while the file is open
+        rows = self._valid_rows.pop(obj.name, None)
+        if rows is None:
+            rows = int(obj.attrs["_valid_rows"])
+        self._unsaved_rows.discard(obj.name)
+        logger.debug('trimming dataset "%s" from %d to %d rows', obj.name, obj.shape[0], rows)
+        obj.resize(rows, axis=0)
+        del obj.attrs["_valid_rows"]
+
+    def _valid_indices(
+        self,
+        dset: h5py.Dataset,
+        indices: Any,
+    ):
+        """Restrict ``indices`` for ``dset`` to the rows which have been written, such that
+        preallocated datasets behave as if they had only these rows. Slices along the first axis
+        and negative integers are converted, an ``Ellipsis`` in front selects the written rows
+        and the remaining axes. Other indices are returned unchanged."""
+        rows = self._valid_rows.get(dset.name)
+        if rows is None:
+            return indices
+
+        if indices is Ellipsis:
+            return slice(0, rows)
+
+        if isinstance(indices, tuple):
+            if not indices:
+                return slice(0, rows)
+            if indices[0] is Ellipsis:
+                rest = indices[1:]
+                if len(rest) >= dset.ndim:
+                    # the ellipsis does not stand for any axis
+                    return self._valid_indices(dset, rest)
+                return (slice(0, rows), Ellipsis) + rest
+            return (self._valid_indices(dset, indices[0]),) + indices[1:]
+
+        if isinstance(indices, slice):
+            return slice(*indices.indices(rows))
+
+        if isinstance(indices, (int, np.integer)):
+            if not -rows <= indices < rows:
+                raise IndexError(
+                    f'index {indices} is out of range for dataset "{dset.name}" with {rows} rows'
+                )
+            return indices % rows
+
+        return indices
+
     def _create_dataset(
         self,
         path: str,
         arr: np.ndarray,
         maxshape: Tuple = None,
         chunks=True,
+        chunk_bytes: int = HDF5_CHUNK_SIZE,
     ):
         """Create hdf5 dataset at the specified path with data arr.
 
@@ -235,7 +746,10 @@ class HDF5FileInterface():
             specify maxshape for the dataset, defaults to shape of arr with
             first axis infinitely extendable
         chunks :
-            wheter to use chunks
+            wheter to use chunks or the chunk shape. If ``True`` and the first axis is
+            extendable, each chunk holds as many rows as fit into ``chunk_bytes``
+        chunk_bytes : int = HDF5_CHUNK_SIZE
+            targeted size of a chunk in bytes
 
         Returns
         -------
@@ -245,14 +759,28 @@ class HDF5FileInterface():
             # make first axis appendable
             maxshape = (None,) + arr.shape[1:]
 
+        if chunks is True and maxshape[0] is None:
+            # the guess of h5py only depends on the shape of arr, which results in tiny chunks
+            # for datasets created from a single row
+            row_nbytes = arr.dtype.itemsize * int(np.prod(arr.shape[1:]))
+            chunks = (max(1, chunk_bytes // max(1, row_nbytes)),) + arr.shape[1:]
+
         logger.debug(
-            'creating dataset "%s" with maxshape %s and dtype %s', path, maxshape, arr.dtype
+            'creating dataset "%s" with maxshape %s, chunks %s and dtype %s',
+            path, maxshape, chunks, arr.dtype
         )
         dset = self._f.create_dataset(path, data=arr, maxshape=maxshape, chunks=chunks)
 
+        if self._preallocate_chunks > 0 and maxshape[0] is None:
+            dset.resize(arr.shape[0] + self._preallocate_chunks * dset.chunks[0], axis=0)
+            self._set_valid_rows(dset, arr.shape[0])
+
         # set attribute
-        logger.debug('attribute for "%s", "created_on"', path)
-        dset.attrs["created_on"] = time.ctime()
+        # fixed size timestamp, cheaper to write and read than a string
+        logger.debug('attribute for "%s", "created_on_ns"', path)
+        dset.attrs.create("created_on_ns", time.time_ns(), dtype=np.int64)
+        if HDF5_CREATED_ON_STRING:
+            dset.attrs["created_on"] = time.ctime()
 
         if self._callback_queue:
             self._callback_queue.put((path, None, True))
@@ -291,7 +819,8 @@ class HDF5FileInterface():
         KeyError
             if there exists no object at the path
         """
-        dset = self._f[path]
+        self.flush(path)
+        dset = self._dataset(path)
 
         if not isinstance(dset, h5py.Dataset):
             raise HDF5FileInterfaceError(
@@ -299,19 +828,70 @@ class HDF5FileInterface():
             )
 
         logger.debug('dataset "%s", field: %s, indices %s', path, field, indices)
+        indices = self._valid_indices(dset, indices)
 
         if field:
             return dset[field][indices]
 
         return dset[indices]
 
+    def read_into(
+        self,
+        path: str,
+        out: np.ndarray = None,
+        indices: slice = (),
+    ) -> np.ndarray:
+        """Read data from a dataset directly into ``out``, without h5py allocating an
+        intermediate array. Use this on the server side for large reads into a reused buffer.
+
+        Parameters
+        ----------
+        path : str
+            path in the hdf5 file
+        out : np.ndarray, optional
+            C-contiguous array with the dtype of the dataset and the shape of the selection. If
+            not provided, a new one is allocated
+        indices : slice, optional = ()
+            slice to index the desired data, use "()" for all data
+
+        Returns
+        -------
+        out : np.ndarray
+
+        Raises
+        ------
+        HDF5FileInterfaceError
+            if the hdf5 file object is not a dataset
+        """
+        self.flush(path)
+        dset = self._dataset(path)
+
+        if not isinstance(dset, h5py.Dataset):
+            raise HDF5FileInterfaceError(
+                f'hdf5 object at path "{path}" is not a Dataset'
+            )
+
+        indices = self._valid_indices(dset, indices)
+
+        if out is None:
+            # shape of the selection, determined on a zero sized view of the same shape
+            shape = np.broadcast_to(np.empty((), dtype=np.int8), dset.shape)[indices].shape
+            out = np.empty(shape, dtype=dset.dtype)
+
+        logger.debug('dataset "%s", indices %s, into %s', path, indices, out.shape)
+        if isinstance(indices, tuple) and not indices:
+            indices = None
+        dset.read_direct(out, source_sel=indices)
+        return out
+
     def get(
         self,
         path: str,
     ):
         """
         Return an object from the hdf5 file, specified with path. Use this to access its children
-        or attributes. If you want to get data from a datset, use :meth:`get_data`
+        or attributes. If you want to get data from a datset, use :meth:`get_data`. Datasets are
+        returned as :class:`ValidRowsDataset`, which hides the spare rows of preallocated datasets.
         
         Parameters
         ----------
@@ -319,7 +899,12 @@ class HDF5FileInterface():
             path in the hdf5 file
         """
         logger.debug('path "%s"', path)
-        return self._f[path]
+        self.flush(path)
+        obj = self._dataset(path)
+
+        if isinstance(obj, h5py.Dataset):
+            return ValidRowsDataset(obj, self)
+        return obj
 
 
     def get_keys(
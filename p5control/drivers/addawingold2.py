@@ -94,7 +94,7 @@ class ADDAwinGold2(BaseDriver):
         logger.debug('%s.get_data()', self._name)
         
         with self.lock:
-            l = [
+            count = int(min(
                 self.inst.Fifo_Full(FifoNo=1),
                 self.inst.Fifo_Full(FifoNo=2),
                 self.inst.Fifo_Full(FifoNo=3),
@@ -103,10 +103,8 @@ class ADDAwinGold2(BaseDriver):
                 self.inst.Fifo_Full(FifoNo=6),
                 self.inst.Fifo_Full(FifoNo=8),
                 self.inst.Fifo_Full(FifoNo=9),
-                    ]
+            ))
 
-        l = list(map(int, l))
-        count = min(l)
         if count <= 0:
             return None
 
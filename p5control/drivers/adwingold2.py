@@ -11,6 +11,17 @@ from .basedriver import BaseDriver
 
 logger = logging.getLogger(__name__)
 
+DATA_DTYPE = np.dtype([
+    ("time", np.float64),
+    ("V1", np.float32),
+    ("V2", np.float32),
+    ("V3", np.float32),
+    ("V4", np.float32),
+])
+"""dtype of the data returned by ``ADwinGold2.get_data``. The voltages are stored as float32,
+which is still finer than the resolution of the ADCs. The time stays float64, since float32
+cannot resolve milliseconds of a unix timestamp."""
+
 class ADwinGold2(BaseDriver):
     """Represents an instrument which magically measures a sine wave. Both the frequency and the amplitude can be changed.
 
@@ -44,6 +55,10 @@ class ADwinGold2(BaseDriver):
         status = self.inst.Process_Status(ProcessNo=10)
         logger.debug("%s.open() %s"%(self._name, status))
 
+        # bound once, since they are called for every fifo in each get_data
+        self._fifo_full = self.inst.Fifo_Full
+        self._get_fifo = self.inst.GetFifo_Double
+
     def close(self):
         """Just logs the call to debug."""
         logger.debug(f'{self._name}.close()')
@@ -77,34 +92,25 @@ class ADwinGold2(BaseDriver):
         """        
         logger.debug(f'{self._name}.get_data()')
         
+        # query the fill levels and drain the fifos in one go, without other commands to the
+        # device in between
+        ff, gf = self._fifo_full, self._get_fifo
         with self.lock:
-            l = [
-                self.inst.Fifo_Full(FifoNo=9),
-                self.inst.Fifo_Full(FifoNo=1),
-                self.inst.Fifo_Full(FifoNo=2),
-                self.inst.Fifo_Full(FifoNo=3),
-                self.inst.Fifo_Full(FifoNo=4)
-                    ]
-
-        l = list(map(int, l))
-        count = min(l)
-        if count <= 0:
-            return None
-
-        with self.lock:
-            times = np.array(self.inst.GetFifo_Double(FifoNo=9, Count=count), dtype='float64') + self._time_offset
-            ch1 = self.inst.GetFifo_Double(FifoNo=1, Count=count)
-            ch2 = self.inst.GetFifo_Double(FifoNo=2, Count=count)
-            ch3 = self.inst.GetFifo_Double(FifoNo=3, Count=count)
-            ch4 = self.inst.GetFifo_Double(FifoNo=4, Count=count)
-
-        return {
-            "time": list(times),
-            "V1": list(ch1),
-            "V2": list(ch2),
-            "V3": list(ch3),
-            "V4": list(ch4),
-        }
+            count = int(min(ff(FifoNo=9), ff(FifoNo=1), ff(FifoNo=2), ff(FifoNo=3), ff(FifoNo=4)))
+            if count <= 0:
+                return None
+
+            # fill a structured array directly, such that the values never have to be converted
+            # to python objects on their way to the data server
+            data = np.empty(count, dtype=DATA_DTYPE)
+            data["time"] = gf(FifoNo=9, Count=count)
+            data["V1"] = gf(FifoNo=1, Count=count)
+            data["V2"] = gf(FifoNo=2, Count=count)
+            data["V3"] = gf(FifoNo=3, Count=count)
+            data["V4"] = gf(FifoNo=4, Count=count)
+        data["time"] += self._time_offset
+
+        return data
 
     """
     Properties
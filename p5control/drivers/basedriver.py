@@ -1,14 +1,23 @@
 """Base Class for a driver, as an example using pyvisa
 """
+import time
+import queue
 import logging
 import threading
 
 import pyvisa
 
 from ..gateway import DataGateway
+from ..settings import DRIVER_SAVE_QUEUE_SIZE
 
 logger = logging.getLogger(__name__)
 
+# put into the queue of the saving thread to stop it
+_SAVE_STOP = object()
+
+# guards creating the data gateways of the drivers
+_dgw_lock = threading.Lock()
+
 class BaseDriverError(Exception):
     """Exception related to the Driver"""
 
@@ -28,6 +37,14 @@ class BaseDriver:
     lock to stop weird behavior.
     """
 
+    # connection to the data server, kept open between measurements
+    _dgw = None
+
+    drain_on_stop = True
+    """whether ``get_data`` is called once more after the measurement has been stopped, to save
+    the data the device has acquired since the last call. Set to ``False`` for devices which do
+    not buffer data."""
+
     def __init__(
         self,
         name: str,
@@ -98,6 +115,22 @@ class BaseDriver:
         self._inst.close()
         self._inst = None
 
+        if self._dgw:
+            self._dgw.disconnect()
+            self._dgw = None
+
+    def _data_gateway(self) -> DataGateway:
+        """Return the gateway to the data server used for saving measured data. It is connected
+        on first use and kept open between measurements, if the connection has been lost, a new
+        one is established."""
+        with _dgw_lock:
+            if self._dgw is None or not self._dgw.connected:
+                if self._dgw is not None:
+                    self._dgw.disconnect()
+                self._dgw = DataGateway()
+                self._dgw.connect()
+            return self._dgw
+
     def __str__(self):
         """Description of the device"""
         if hasattr(self, "_address"):
@@ -141,59 +174,126 @@ class BaseDriver:
                 delay = 0.5
         logger.info('device "%s" measuring with delay %5.3fs', self._name, delay)
 
-        try:
+        if self._implements("setup_measuring"):
             self.setup_measuring()
-        except NotImplementedError:
+        else:
             logger.info('device "%s" does not implement setup_measuring, skipped.', self._name)
 
         # Connect to data server
-        dgw = DataGateway()
-        dgw.connect()
-
-        if entry_barrier:
-            logger.info('device "%s" waiting at entry_barrier in _measurement_thread.', self._name)
-            entry_barrier.wait()
-            logger.info('device "%s" released at entry_barrier', self._name)
+        dgw = self._data_gateway()
+
+        # the data is saved by a separate thread, such that the device can already be read again
+        # while the previous data is still being sent to the data server. If saving fails, the
+        # saving thread sets save_failed and the measurement is stopped.
+        save_queue = queue.Queue(maxsize=DRIVER_SAVE_QUEUE_SIZE)
+        save_failed = threading.Event()
+        saving_thread = threading.Thread(
+            target=self._saving_thread,
+            args=[save_queue, save_failed, hdf5_path, dgw],
+            daemon=True,
+        )
+        saving_thread.start()
 
         try:
-            self.start_measuring()
-        except NotImplementedError:
-            logger.info('device "%s" does not implement start_measuring, skipped.', self._name)
-
-        # Measurement block
-        while not stop_event.wait(delay):
-
-            try:
-                # get data and save it
-                res = self.get_data()
-                self._save_data(hdf5_path, res, dgw)
+            if entry_barrier:
+                logger.info(
+                    'device "%s" waiting at entry_barrier in _measurement_thread.', self._name)
+                entry_barrier.wait()
+                logger.info('device "%s" released at entry_barrier', self._name)
 
-            # this device cannot be measured
-            except NotImplementedError:
+            if self._implements("start_measuring"):
+                self.start_measuring()
+            else:
                 logger.info(
-                    'device "%s" does not implement get_data, stopping measurement.', self._name)
-                break
+                    'device "%s" does not implement start_measuring, skipped.', self._name)
+
+            # Measurement block, get_data is called every delay seconds, independent of how long
+            # it takes. If it falls behind by more than one period, it waits a full period again
+            # instead of trying to catch up.
+            deadline = time.monotonic() + delay
+            while not stop_event.wait(max(0.0, deadline - time.monotonic())):
+                deadline += delay
+                if deadline < time.monotonic():
+                    deadline = time.monotonic() + delay
+
+                if save_failed.is_set():
+                    logger.error(
+                        'device "%s" can\'t save its data, stopping measurement.', self._name)
+                    break
+
+                try:
+                    # get data and save it
+                    res = self.get_data()
+                    save_queue.put(res)
+
+                # this device cannot be measured
+                except NotImplementedError:
+                    logger.info(
+                        'device "%s" does not implement get_data, stopping measurement.',
+                        self._name)
+                    break
+            else:
+                # save any remaining data
+                if self.drain_on_stop and self._implements("get_data"):
+                    res = self.get_data()
+                    save_queue.put(res)
 
-        # save any remaining data
-        try:
-            res = self.get_data()
-            self._save_data(hdf5_path, res, dgw)
-        except NotImplementedError:
-            pass
+        finally:
+            # block until everything has been saved, also if measuring failed
+            save_queue.put(_SAVE_STOP)
+            saving_thread.join()
 
-        logger.info('stopping measurement of device "%s"', self._name)
+            logger.info('stopping measurement of device "%s"', self._name)
 
-        try:
-            self.stop_measuring()
-        except NotImplementedError:
-            logger.info('device "%s" does not implement stop_measuring, skipped.', self._name)
+            try:
+                if self._implements("stop_measuring"):
+                    self.stop_measuring()
+                else:
+                    logger.info(
+                        'device "%s" does not implement stop_measuring, skipped.', self._name)
+            finally:
+                # release the other devices, even if this one failed
+                if exit_barrier:
+                    logger.info(
+                        'device "%s" waiting at exit_barrier in _measurement_thread.', self._name)
+                    exit_barrier.wait()
+                    logger.info('device "%s" released at exit_barrier', self._name)
+
+    def _implements(self, method: str) -> bool:
+        """Whether this driver overwrites ``method`` of ``BaseDriver``, which only raises
+        ``NotImplementedError``."""
+        return getattr(type(self), method) is not getattr(BaseDriver, method)
+
+    def _saving_thread(
+        self,
+        save_queue: queue.Queue,
+        save_failed: threading.Event,
+        hdf5_path: str,
+        dgw: DataGateway,
+    ):
+        """Thread which saves the results of ``get_data`` taken from ``save_queue`` with
+        ``_save_data`` until it gets ``_SAVE_STOP``. If the connection to the data server has been
+        lost, it reconnects and tries again once. If saving fails, ``save_failed`` is set and the
+        remaining results are discarded, such that the measuring thread does not block."""
+        while True:
+            res = save_queue.get()
+            if res is _SAVE_STOP:
+                break
 
-        dgw.disconnect()
+            if save_failed.is_set():
+                continue
 
-        if exit_barrier:
-            logger.info('device "%s" waiting at exit_barrier in _measurement_thread.', self._name)
-            exit_barrier.wait()
-            logger.info('device "%s" released at exit_barrier', self._name)
+            try:
+                try:
+                    self._save_data(hdf5_path, res, dgw)
+                except EOFError:
+                    logger.warning(
+                        'device "%s" lost connection to the data server, reconnecting', self._name)
+                    dgw.reconnect()
+                    self._save_data(hdf5_path, res, dgw)
+            except Exception:
+                logger.exception('device "%s" failed to save data', self._name)
+                save_failed.set()
 
     def _save_data(
         self,
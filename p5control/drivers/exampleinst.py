@@ -21,7 +21,8 @@ class ExampleInst(BaseDriver):
 
     def __init__(self, name: str):
         self._name = name
-        self._offset = np.random.rand() * 50
+        self._rng = np.random.default_rng()
+        self._offset = self._rng.random() * 50
 
         self._amplitude = 1.1
         self._freq = 1.0
@@ -50,10 +51,12 @@ class ExampleInst(BaseDriver):
     """
     def start_measuring(self):
         """Start the measurement. Saves the current time such
-        that we can keep track of how much time has passed
-        when :meth:`ExampleInst.get_data` gets called.
+        that we can keep track of how many samples have been
+        taken when :meth:`ExampleInst.get_data` gets called.
         """
-        self.last_time = time.time()
+        self._t0 = time.time()
+        self._t0_monotonic = time.monotonic()
+        self._next_index = 0
 
     def get_data(self):
         """Calculates sine wave over the time passed since the
@@ -61,18 +64,19 @@ class ExampleInst(BaseDriver):
         """
         logger.debug(f'{self._name}.get_data()')
 
-        now = time.time()
+        # samples are taken every 0.1s since the start, counted on the monotonic clock such that
+        # changes to the system time do not affect the number of samples
+        stop = int(np.ceil((time.monotonic() - self._t0_monotonic) / 0.1))
+        times = self._t0 + 0.1 * np.arange(self._next_index, stop, dtype=np.float64)
+        jitter, noise = self._rng.random((2, times.size))
+        values = self._amplitude * np.sin(self._freq*(times + 0.1*jitter) + self._offset) + 0.3*noise
 
-        times = np.arange(self.last_time, now, 0.1)
-        values = [self._amplitude * np.sin(self._freq*(t + 0.1*np.random.rand()) + self._offset) + 0.3*np.random.rand() for t in times]
-        values = np.array(values)
-
-        # set time for next cycle
-        self.last_time = now
+        # continue with the next sample in the next cycle
+        self._next_index = max(stop, self._next_index)
 
         return {
-            "time": list(times),
-            "V": list(values),
+            "time": times.tolist(),
+            "V": values.tolist(),
         }
 
 
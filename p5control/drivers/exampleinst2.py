@@ -9,8 +9,8 @@ class ExampleInst2(ExampleInst):
         values = np.sin(times + 0.1 * time.time())
 
         return {
-            "time": list(times),
-            "val": list(values)
+            "time": times.tolist(),
+            "val": values.tolist()
         }
 
     def _save_data(self, hdf5_path: str, array, dgw):
@@ -10,6 +10,9 @@ from .basedriver import BaseDriver
 logger = logging.getLogger(__name__)
 
 class GIR2002(BaseDriver):
+    # every call reads a single new value, there is nothing left to save after stopping
+    drain_on_stop = False
+
     def __init__(self, name, address='COM3', res: float = 0.1):
         self._name = name
         self._address = address
@@ -51,6 +51,9 @@ class Keysight34461A(ThreadSafeBaseDriver):
             self._inst.write('TRIG:SOUR IMM')
             self._inst.write("TRIG:COUN INF")
             self._inst.write("SAMP:COUN MAX")
+            # transfer readings as little endian float32 instead of ascii
+            self._inst.write("FORM:DATA REAL,32")
+            self._inst.write("FORM:BORD SWAP")
             self._inst.write('DISP:TEXT "measuring    "')
         self.textcnt = 0
 
@@ -65,10 +68,12 @@ class Keysight34461A(ThreadSafeBaseDriver):
             # the data it has measured up to this point. This is important to make sure that the
             # time stamps are accurate.
             now = time.time()
-            data = self._inst.query("R?")
+            # the readings are returned as definite length block, see page 205 in programmer
+            # manual, which pyvisa parses directly into an array
+            data = self._inst.query_binary_values(
+                "R?", datatype='f', is_big_endian=False, container=np.array
+            )
 
-        # see page 205 in programmer manual
-        data = np.fromstring(data[2+int(data[1]):], sep=",", dtype='f')
         times = np.linspace(self.last_time, now, len(data), endpoint=False)
 
         # set time for next cycle
@@ -44,9 +44,8 @@ class KeysightB2962A(ThreadSafeBaseDriver):
 
     def reset(self):
         with self.lock:
-            self._inst.write("*CLS") # clear status command
-            self._inst.write("*RST") # reset the instrument for SCPI operation
-            self._inst.query("*OPC?") # wait for the operation to complete
+            # clear status, reset the instrument for SCPI operation and wait for it to complete
+            self._inst.query("*CLS;*RST;*OPC?")
             self.output = False
             self.max_current = 0
             self.frequency = 0
@@ -74,14 +73,18 @@ class KeysightB2962A(ThreadSafeBaseDriver):
 
     def triangle_mode(self, ch=None):
         ch = self._get_channel(ch)
+        # send the setup of all channels as one compound command and wait for it to complete
+        cmds = []
         for c in ch:
-            with self.lock:
-                self._inst.write(f":sour{c}:func:mode volt")
-                self._inst.write(f":sour{c}:volt:mode arb")
-                self._inst.write(f":sour{c}:arb:func tri")
-                self._inst.write(f":sour{c}:arb:volt:tri:star:time 0")
-                self._inst.write(f":sour{c}:arb:volt:tri:end:time 0")
-                self._inst.write(f":trig{c}:tran:sour aint")
+            cmds += [
+                f":sour{c}:func:mode volt",
+                f":sour{c}:volt:mode arb",
+                f":sour{c}:arb:func tri",
+                f":sour{c}:arb:volt:tri:star:time 0",
+                f":sour{c}:arb:volt:tri:end:time 0",
+                f":trig{c}:tran:sour aint",
+            ]
+        self.query(";".join(cmds + ["*OPC?"]))
             
     def trigger(self, ch=None):
         if ch is None:
@@ -95,68 +98,65 @@ class KeysightB2962A(ThreadSafeBaseDriver):
             outp = 'on'
         else:
             outp = 'off'
-        for c in ch:
-            self.write(f":outp{c} {outp}")
+        self.write(";".join(f":outp{c} {outp}" for c in ch))
         self.output = val
 
     def output_off(self, ch=None):
         ch = self._get_channel(ch)
-        for c in ch:
-            self.write(f":outp{c} off")
+        self.write(";".join(f":outp{c} off" for c in ch))
         self.output = False
 
     def set_max_current(self, max_current, ch=None):
         ch = self._get_channel(ch)
-        for c in ch:
-            self.write(f":SENSe{c}:CURRent:DC:PROTection:LEVel:BOTH {max_current}")
+        self.write(";".join(f":SENSe{c}:CURRent:DC:PROTection:LEVel:BOTH {max_current}" for c in ch))
         self._max_current = max_current
 
     def set_rise_time(self, t, ch=None):
         ch = self._get_channel(ch)
-        for c in ch:
-            self.write(f":sour{c}:arb:volt:tri:rtim {t}")
+        self.write(";".join(f":sour{c}:arb:volt:tri:rtim {t}" for c in ch))
 
     def set_fall_time(self, t, ch=None):
         ch = self._get_channel(ch)
-        for c in ch:
-            self.write(f":sour{c}:arb:volt:tri:ftim {t}")
+        self.write(";".join(f":sour{c}:arb:volt:tri:ftim {t}" for c in ch))
 
     def set_frequency(self, frequency):
         _half_time = .5/frequency
-        self.set_rise_time(_half_time)
-        self.set_fall_time(_half_time)
+        # same as set_rise_time and set_fall_time, but in one compound command
+        self.write(";".join(
+            f":sour{c}:arb:volt:tri:{t}tim {_half_time}"
+            for c in self._get_channel() for t in ("r", "f")
+        ))
         self.frequency = frequency
         
     def set_voltage(self, V, ch=None):
         ch = self._get_channel(ch)
-        for c in ch:
-            self.write(f":sour{c}:volt {V}")
+        self.write(";".join(f":sour{c}:volt {V}" for c in ch))
     
     def set_triangle_top(self, V, ch=None):
         ch = self._get_channel(ch)
-        for c in ch:
-            self.write(f":sour{c}:arb:volt:tri:top {V}")
+        self.write(";".join(f":sour{c}:arb:volt:tri:top {V}" for c in ch))
 
     def set_triangle_btm(self, V, ch=None):
         ch = self._get_channel(ch)
-        for c in ch:
-            self.write(f":sour{c}:arb:volt:tri:star {V}")
+        self.write(";".join(f":sour{c}:arb:volt:tri:star {V}" for c in ch))
 
     def set_amplitude(self, amplitude):
         _half_amplitude = amplitude / 2
-        self.set_voltage(-_half_amplitude, ch=1)
-        self.set_voltage(_half_amplitude, ch=2)
-
-        self.set_triangle_btm(-_half_amplitude, ch=1)
-        self.set_triangle_btm(_half_amplitude, ch=2)
-
-        self.set_triangle_top(_half_amplitude, ch=1)
-        self.set_triangle_top(-_half_amplitude, ch=2)
+        # same as set_voltage, set_triangle_btm and set_triangle_top for both channels, but in
+        # one compound command
+        self.query(";".join([
+            f":sour1:volt {-_half_amplitude}",
+            f":sour2:volt {_half_amplitude}",
+            f":sour1:arb:volt:tri:star {-_half_amplitude}",
+            f":sour2:arb:volt:tri:star {_half_amplitude}",
+            f":sour1:arb:volt:tri:top {_half_amplitude}",
+            f":sour2:arb:volt:tri:top {-_half_amplitude}",
+            "*OPC?",
+        ]))
         self.amplitude = amplitude
     
     def set_sweep_count(self, N: int, ch=None):
         ch = self._get_channel(ch)
-        for c in ch:
-            self.write(f":trig{c}:tran:coun {N}")
+        self.write(";".join(f":trig{c}:tran:coun {N}" for c in ch))
         self.sweep_count = N
 
@@ -10,6 +10,9 @@ from .basedriver import BaseDriver
 logger = logging.getLogger(__name__)
 
 class ZNB40(BaseDriver):
+    # every call triggers a new sweep, there is nothing left to save after stopping
+    drain_on_stop = False
+
     def __init__(self, 
                  name, 
                  address='192.168.1.104', 
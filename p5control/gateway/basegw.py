@@ -2,6 +2,7 @@
 This module provides an interface to control devices on an instrument server.
 """
 import logging
+import random
 import time
 
 import rpyc
@@ -44,6 +45,9 @@ class BaseGateway:
         self.conn_timeout = conn_timeout
 
         self._connection = None
+        # methods of the root object on the server, such that looking them up again does not
+        # need a request to the server
+        self._root_attrs = {}
 
         self.allow_callback = allow_callback
         self._bgsrv = None
@@ -65,26 +69,20 @@ class BaseGateway:
             Connection to the Server failed
         """
         timeout = time.time() + self.conn_timeout
+        # retry quickly first, in case the server is just starting up
+        delay = 0.01
         while True:
             try:
-                # connect to the rpyc server
-                if config:
-                    self._connection = rpyc.connect(
-                        self.addr,
-                        self.port,
-                        config=config,
-                    )
-                else:
-                    self._connection = rpyc.connect(
-                        self.addr,
-                        self.port,
-                    )
+                # connect to the rpyc server, same as rpyc.connect but with TCP_NODELAY, such
+                # that small requests and callbacks are not held back by Nagle's algorithm
+                stream = rpyc.SocketStream.connect(self.addr, self.port, nodelay=True)
+                self._connection = rpyc.connect_stream(stream, config=config or {})
 
                 if self.allow_callback:
                     logger.debug('starting BgServingThread')
                     self._bgsrv = rpyc.BgServingThread(
                         self._connection,
-                        callback=lambda: print("bg stopped"),
+                        callback=lambda: logger.debug('BgServingThread stopped'),
                         sleep_interval=0.1
                     )
 
@@ -99,14 +97,18 @@ class BaseGateway:
                         f'Failed to connect to server at "{self.addr}:{self.port}"'
                     ) from exc
 
-                # limit the retrying rate
-                time.sleep(0.5)
+                # limit the retrying rate, backing off exponentially up to 0.5s. The wait is
+                # drawn at random below that, such that gateways which lost the same server do
+                # not all retry at once
+                time.sleep(random.uniform(0, delay))
+                delay = min(2 * delay, 0.5)
             else:
                 logger.info('Gateway connected to server at "%s":%s', self.addr, self.port)
                 break
 
     def disconnect(self):
         """Disconnect form the server"""
+        self._root_attrs.clear()
         if self._connection:
             self._connection.close()
             self._connection = None
@@ -142,17 +144,54 @@ class BaseGateway:
         """Python context manager teardown"""
         self.disconnect()
 
+    def _root_attr(self, attr: str):
+        """Return ``attr`` of the root object on the server. Callable attributes are cached until
+        the gateway disconnects, other values are always looked up again.
+
+        Raises
+        ------
+        EOFError
+            if the connection has been lost, e.g. because the server stopped, or the gateway is
+            not connected
+        """
+        if self._connection is None:
+            raise EOFError('not connected to the server')
+        if not self._bgsrv:
+            # without a serving thread, a closed connection is only noticed when reading from
+            # it. Polling returns right away if the server has not sent anything
+            self._connection.poll(0)
+        if self._connection.closed:
+            raise EOFError('connection to the server has been closed')
+
+        try:
+            return self._root_attrs[attr]
+        except KeyError:
+            value = getattr(self._connection.root, attr)
+            if callable(value):
+                self._root_attrs[attr] = value
+            return value
+
+    def _call_root(self, attr: str, *args, **kwargs):
+        """Call the method ``attr`` of the root object on the server. If the connection has been
+        lost, e.g. because the server restarted, reconnect and call it once more."""
+        try:
+            return self._root_attr(attr)(*args, **kwargs)
+        except EOFError:
+            self.reconnect()
+            return self._root_attr(attr)(*args, **kwargs)
+
     def __getattr__(
         self,
         attr: str,
     ):
         """Allow shorthand gateway.attribute for gateway.root.attribute"""
-        if self._connection:
+        # private attributes are never exposed by the server, so do not ask it
+        if not attr.startswith('_') and self._connection:
             try:
-                return getattr(self._connection.root, attr)
+                return self._root_attr(attr)
             except EOFError:
                 # the server might have disconnected - try reconnecting
                 self.reconnect()
-                return getattr(self._connection.root, attr)
+                return self._root_attr(attr)
         # default python implementation
         return self.__getattribute__(attr)
@@ -1,9 +1,10 @@
 """
 This module provides an interface to the data server
 """
+import pickle
 import logging
 
-from rpyc.utils.classic import obtain
+import rpyc
 
 from .basegw import BaseGateway, BaseGatewayError
 from ..settings import DATASERV_DEFAULT_PORT, get_setting
@@ -35,19 +36,45 @@ class DataGateway(BaseGateway):
         super().__init__(addr, port, conn_timeout, allow_callback)
 
     def connect(self, config=None):
-        # we need to allow pickling for the transfer of numpy arrays
-        if config:
-            config["allow_pickle"] = True
-        else:
-            config={'allow_pickle': True}
+        # we need to allow pickling for the transfer of numpy arrays, merged into a copy such
+        # that the config passed in is not changed
+        config = {**(config or {}), 'allow_pickle': True}
         super().connect(config=config)
 
     def get_data(self, path, indices: slice = (), field: str = None):
-        """Wraps ``self._connection.root.get_data`` to use ``obtain`` on the result
-        in order to transfer the data to a local object.
+        """Wraps ``self._connection.root.get_data`` to transfer the data to a local object. The
+        server sends the result already pickled, which saves the round trip of ``obtain``.
         """
         logger.debug('obtaining result for "%s", %s, %s', path, indices, field)
-        return obtain(self._connection.root.get_data(path, indices, field))
+        return pickle.loads(self._call_root('get_data_pickled', path, indices, field))
+
+    def get_data_many(self, requests):
+        """Like ``get_data`` for several datasets at once. The requests are all sent to the server
+        before waiting for the first result, such that they only cost one round trip together.
+
+        Parameters
+        ----------
+        requests : iterable
+            tuples ``(path,)``, ``(path, indices)`` or ``(path, indices, field)``, with the same
+            meaning as the arguments of ``get_data``
+
+        Returns
+        -------
+        list
+            the results in the order of ``requests``
+        """
+        def send():
+            get_data = rpyc.async_(self._root_attr('get_data_pickled'))
+            return [get_data(*request) for request in requests]
+
+        requests = list(requests)
+        try:
+            results = send()
+            return [pickle.loads(res.value) for res in results]
+        except EOFError:
+            self.reconnect()
+            results = send()
+            return [pickle.loads(res.value) for res in results]
 
     def register_callback(self, path, func, is_group: bool = False):
         """Wraps ``self._connection.root.register_callback`` to check whether callbacks are
@@ -58,4 +85,4 @@ class DataGateway(BaseGateway):
                 'Can\'t register callback, because callbacks are not enabled for the gateway')
 
         logger.debug('"%s", %s, %s', path, func, is_group)
-        return self._connection.root.register_callback(path, func, is_group)
+        return self._call_root('register_callback', path, func, is_group)
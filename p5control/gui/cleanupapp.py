@@ -48,9 +48,11 @@ class CleanupApp(QApplication):
     def exec(self, *args, **kwargs):
         """
         Overwrites exec to explicitly call the garbage collector after the app
-        has been closed and then logs any leaked_widgets.
+        has been closed and then logs any leaked_widgets, if debug logging is enabled.
         """
         super().exec(*args, **kwargs)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         # invoke garbage collector to make sure we don't get any false leak reports
         gc.collect()
         # report Qt leaks
@@ -73,7 +75,6 @@ class CleanupApp(QApplication):
         rpyc_thread.wait()
 
         for widget in self.allWidgets():
-            try:
-                widget.cleanup()
-            except AttributeError:
-                pass
+            cleanup = getattr(widget, 'cleanup', None)
+            if callable(cleanup):
+                cleanup()
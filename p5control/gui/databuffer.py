@@ -6,9 +6,9 @@ import threading
 import logging
 
 import numpy as np
-from rpyc.utils.classic import obtain
 
 from ..gateway import DataGateway
+from ..util import maybe_obtain
 from .guisettings import DATA_BUFFER_MAX_LENGTH, DOWN_SAMPLE
 
 logger = logging.getLogger(__name__)
@@ -47,7 +47,13 @@ class DataBuffer:
         self.max_length = max_length
         self.down_sample = down_sample
 
-        self.data = None
+        # the buffered rows are _buf[_start:_stop], _buf has room for more rows after _stop
+        self._buf = None
+        self._start = 0
+        self._stop = 0
+        # number of rows since the last kept row, modulo down_sample, such that down sampling
+        # continues across callbacks
+        self._ds_phase = 0
         self.data_lock = threading.Lock()
 
         # try to get existing data
@@ -71,20 +77,66 @@ class DataBuffer:
             the new data to append to the dataset
         """
         with self.data_lock:
-            arr = obtain(arr)
+            arr = maybe_obtain(arr)
             if self.down_sample > 1:
+                start = -self._ds_phase % self.down_sample
                 if isinstance(arr, dict):
-                    arr = {k: v[::self.down_sample] for k,v in arr.items()}
+                    length = len(next(iter(arr.values()), ()))
+                    arr = {k: v[start::self.down_sample] for k,v in arr.items()}
                 else:
-                    arr = arr[::self.down_sample]
+                    length = len(arr)
+                    arr = arr[start::self.down_sample]
+                self._ds_phase = (self._ds_phase + length) % self.down_sample
+
+            self._extend(arr)
+
+    @property
+    def data(self):
+        """The buffered data, at most ``max_length`` rows, or ``None`` if there is none."""
+        if self._buf is None:
+            return None
+        return self._buf[self._start:self._stop]
+
+    @data.setter
+    def data(self, value):
+        self._buf = value
+        self._start = 0
+        self._stop = 0 if value is None else len(value)
+
+    def _extend(self, arr):
+        """Append ``arr`` to the buffered data. The rows are copied into the free space after the
+        buffered rows, only if there is no more space, the last rows are moved to a new array
+        with room for ``max_length`` more rows. Arrays handed out by ``data`` are never written
+        to again, such that they can be used without holding the lock."""
+        if self._buf is None:
+            self.data = self._last_rows(arr)
+            return
+
+        if arr.dtype != self._buf.dtype or arr.shape[1:] != self._buf.shape[1:]:
+            self.data = self._last_rows(np.concatenate((self.data, arr)))
+            return
+
+        n = len(arr)
+        if n >= self.max_length:
+            self.data = self._last_rows(arr)
+            return
+
+        if self._stop + n > len(self._buf):
+            keep = min(self._stop - self._start, self.max_length - n)
+            buf = np.empty((2 * self.max_length,) + arr.shape[1:], dtype=arr.dtype)
+            buf[:keep] = self._buf[self._stop - keep:self._stop]
+            self._buf, self._start, self._stop = buf, 0, keep
 
-            if self.data is None:
-                self.data = arr
-            else:
-                self.data = np.concatenate((self.data, arr))
+        self._buf[self._stop:self._stop + n] = arr
+        self._stop += n
+        self._start = max(self._start, self._stop - self.max_length)
 
-            if self.data.shape[0] > self.max_length:
-                self.data = self.data[len(arr):]
+    def _last_rows(self, arr):
+        """The last ``max_length`` rows of ``arr``, copied if they would be a view, such that the
+        buffer does not keep a larger array alive through it."""
+        if len(arr) > self.max_length or arr.base is not None:
+            return arr[-self.max_length:].copy()
+        return arr
 
     def cleanup(self):
         """
@@ -100,6 +152,7 @@ class DataBuffer:
         """
         with self.data_lock:
             self.data = None
+            self._ds_phase = 0
 
     def reload(
         self,
@@ -126,3 +179,4 @@ class DataBuffer:
             self.down_sample = down_sample
 
             self.data = data
+            self._ds_phase = 0
@@ -24,6 +24,20 @@ from ..settings import DATASERV_DEFAULT_PORT
 
 logger = logging.getLogger(__name__)
 
+# builtin containers returned by the server are copied in a single request, instead of
+# requesting every element through a netref
+OBTAIN_TYPES = frozenset(['builtins.list', 'builtins.tuple', 'builtins.dict', 'builtins.set'])
+
+def _wrap_result(res, dgw):
+    """Return ``res`` in the form handed to the gui: netrefs to builtin containers are
+    obtained, other netrefs are wrapped in :class:`WrapNetref`."""
+    if isinstance(res, BaseNetref):
+        # the type name is part of the netref, checking it does not need a request
+        if res.____id_pack__[0] in OBTAIN_TYPES:
+            return obtain(res)
+        return WrapNetref(res, dgw)
+    return res
+
 class WrapNetref():
     """
     Wraps rpyc netref such that all requests made are handled in try catch expressions
@@ -37,17 +51,20 @@ class WrapNetref():
     def __init__(self, netref, dgw) -> None:
         self._secret_netref = netref
         self._secret_type = type(netref)
+        # the class of the remote object does not change, so it is only requested once
+        self._secret_class = None
+        # name of the attribute of the root object this netref has been looked up as, such that
+        # it can be looked up again after reconnecting
+        self._secret_root_attr = None
         self.dgw = dgw
 
     def __call__(self, *args, **kwargs):
         logger.debug('Calling %s with args %s and kwargs %s',
-            self._secret_netref, str(args), str(kwargs))
+            self._secret_netref, args, kwargs)
         try:
             res = self._secret_netref(*args, **kwargs)
 
-            if isinstance(res, BaseNetref):
-                return WrapNetref(res, self.dgw)
-            return res
+            return _wrap_result(res, self.dgw)
 
         except EOFError as error:
             # make sure the connection is closed
@@ -63,11 +80,13 @@ class WrapNetref():
 
                     # try operation again, if it fails again, return to retrying
                     try:
+                        if self._secret_root_attr:
+                            # the netref belongs to the closed connection
+                            self._secret_netref = getattr(
+                                self.dgw._connection.root, self._secret_root_attr)
                         res = self._secret_netref(*args, **kwargs)
 
-                        if isinstance(res, BaseNetref):
-                            return WrapNetref(res, self.dgw)
-                        return res
+                        return _wrap_result(res, self.dgw)
                     except EOFError as newerror:
                         self.dgw.disconnect()
                         logger.error(str(error))
@@ -87,11 +106,18 @@ class WrapNetref():
 
     @property
     def __class__(self):
-        return self.dgw.network_safe_getattr(self._secret_netref, '__class__')
+        if self._secret_class is None:
+            self._secret_class = self.dgw.network_safe_getattr(self._secret_netref, '__class__')
+        return self._secret_class
+
+    def obtain(self):
+        """Copy the wrapped remote object to the local machine in a single request."""
+        return obtain(self._secret_netref)
 
-    def __reduce__(self):
-        """Allow for pickling of the wrapped netref."""
-        return pickle.loads, (pickle.dumps(self._secret_netref),)
+    def __reduce_ex__(self, protocol):
+        """Allow for pickling of the wrapped netref, the remote object is pickled by the server
+        once and unpickled into a local object on load."""
+        return self._secret_netref.__reduce_ex__(protocol)
 
     def __str__(self) -> str:
         return self.dgw.network_safe_getattr(self._secret_netref, '__str__', call=True)
@@ -141,12 +167,39 @@ class GuiDataGateway(DataGateway):
     ):
         """Allow shorthand gateway.attribute for gateway.root.attribute"""
         logger.debug('dgw.__getattr__("%s")', attr)
-        if self._connection:
-            root = self.network_safe_getattr(self._connection, 'root')
-            return self.network_safe_getattr(root, attr)
+        # private attributes are never exposed by the server, so do not ask it
+        if not attr.startswith('_') and self._connection:
+            return self._root_attr(attr)
         # default python implementation
         return self.__getattribute__(attr)
 
+    def _root_attr(self, attr: str):
+        """Overwrite :meth:`p5control.gateway.basegw.BaseGateway._root_attr` to look up
+        attributes which are not cached with :meth:`GuiDataGateway.network_safe_getattr`. Cached
+        methods are dropped if the connection has been closed, and look themselves up again if
+        calling them makes the gateway reconnect."""
+        if self._connection is None:
+            # make sure the connection is closed and wait for it to be established again
+            self.disconnect()
+            self.connect_to_filename(
+                EOFError('not connected to the data server'), self.dataserv_filename)
+        elif self._connection.closed:
+            self._root_attrs.clear()
+
+        try:
+            return self._root_attrs[attr]
+        except KeyError:
+            root = self.network_safe_getattr(self._connection, 'root')
+            value = self.network_safe_getattr(root, attr)
+            # a WrapNetref is always callable, check the object behind it
+            if isinstance(value, WrapNetref):
+                if callable(value._secret_netref):
+                    value._secret_root_attr = attr
+                    self._root_attrs[attr] = value
+            elif callable(value):
+                self._root_attrs[attr] = value
+            return value
+
     def network_safe_getattr(
         self,
         obj: Any,
@@ -159,15 +212,13 @@ class GuiDataGateway(DataGateway):
         attributes of any netref in a gui application.
         """
         try:
-            logger.debug("safe %s, '%s'", str(obj), attr)
+            logger.debug("safe %s, '%s'", obj, attr)
             res = getattr(obj, attr)
 
             if call:
                 res = res()
 
-            if isinstance(res, BaseNetref):
-                return WrapNetref(res, self)
-            return res
+            return _wrap_result(res, self)
 
         except EOFError as error:
             logger.warning('EOFError %s', error)
@@ -192,15 +243,13 @@ class GuiDataGateway(DataGateway):
                             logger.debug('retrying obj: %s, attr: "%s"', self._connection, attr)
                             res = getattr(self._connection, attr)
                         else:
-                            logger.debug('retrying obj: %s, attr: "%s"', str(obj), attr)
+                            logger.debug('retrying obj: %s, attr: "%s"', obj, attr)
                             res = getattr(obj, attr)
 
                         if call:
                             res = res()
 
-                        if isinstance(res, BaseNetref):
-                            return WrapNetref(res, self)
-                        return res
+                        return _wrap_result(res, self)
 
                     except EOFError as newerror:
                         logger.warning('EOFError %s', error)
@@ -295,11 +344,10 @@ class GuiDataGateway(DataGateway):
         """
         logger.debug('"%s", %s, %s', path, indices, field)
 
-        root = self.network_safe_getattr(self._connection, 'root')
-        func = self.network_safe_getattr(root, 'get_data')
+        func = self._root_attr('get_data_pickled')
         res = func(path, indices, field)
 
-        return obtain(res)
+        return pickle.loads(res)
 
     def register_callback(self, path, func, is_group: bool = False):
         """
@@ -313,8 +361,7 @@ class GuiDataGateway(DataGateway):
 
         logger.debug('"%s", %s, %s', path, func, is_group)
 
-        root = self.network_safe_getattr(self._connection, 'root')
-        f = self.network_safe_getattr(root, 'register_callback')
+        f = self._root_attr('register_callback')
         res = f(path, func, is_group)
 
         return res
@@ -1,11 +1,10 @@
 from typing import Union
 
-from rpyc.utils.classic import obtain
-
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QDoubleSpinBox, QAbstractSpinBox
 
 from ...gateway import DataGateway
+from ...util import maybe_obtain
 
 class MonitorValueBox(QDoubleSpinBox):
     """Widget which subscribes to a value on the dataserver and
@@ -56,7 +55,7 @@ class MonitorValueBox(QDoubleSpinBox):
 
     def _callback(self, arr):
         """Callback which extracts the value from the appended array."""
-        arr = obtain(arr)
+        arr = maybe_obtain(arr)
 
         val = arr[self.selector][-1]
 
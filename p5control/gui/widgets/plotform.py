@@ -10,6 +10,7 @@ from qtpy.QtGui import QColor, QIntValidator
 from pyqtgraph import ColorButton
 
 from ...gateway import DataGateway
+from ..threadcontrol import run_async
 
 
 class PlotForm(QWidget):
@@ -48,6 +49,11 @@ class PlotForm(QWidget):
         self.config = {}
         self.node = None
 
+        # configs waiting for their data buffer to be reloaded, by id, and the id of the one
+        # which is reloaded right now
+        self._queued_updates = {}
+        self._updating_id = None
+
         self._widget_pen = ColorButton()
 
         self.max_length = QLineEdit()
@@ -233,11 +239,30 @@ class PlotForm(QWidget):
             value = widget._get_value()
             with self.config["lock"]:
                 self.config[key] = value
-            self.config.config_update()
-            self.updatedConfig.emit(self.config["id"])
+            # reloading the data buffer requests the data again, which should not block the gui
+            self._queued_updates[self.config["id"]] = self.config
+            self._next_config_update()
         else:
             return self.__getattribute__(attr)
 
+    def _next_config_update(self):
+        """Reload the data buffer of the next queued config in another thread, unless one is
+        being reloaded already. Changes to a config which is still queued are applied together.
+        """
+        if self._updating_id is not None or not self._queued_updates:
+            return
+
+        config_id = next(iter(self._queued_updates))
+        config = self._queued_updates.pop(config_id)
+        self._updating_id = config_id
+        run_async(config.config_update, self, callback=self._config_update_finished)
+
+    @Slot()
+    def _config_update_finished(self):
+        config_id, self._updating_id = self._updating_id, None
+        self.updatedConfig.emit(config_id)
+        self._next_config_update()
+
     @Slot(object)
     def _handle_pen(self, color: ColorButton):
         color = color.color()
@@ -3,6 +3,7 @@ This file provides a basic rpyc service which is wrapped to allow for a Threaded
 started and stopped
 """
 import time
+import socket
 import threading
 import logging
 
@@ -43,6 +44,9 @@ class BaseServer(Service):
                 'allow_public_attrs': True,
             },
         )
+        # accepted connections inherit TCP_NODELAY, the replies are then not held back by Nagle's
+        # algorithm waiting for the client to acknowledge the previous one
+        self._rpyc_server.listener.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self._rpyc_server.start()
         # start is blocking, set the event when the server has closed
         self.RPYC_SERVER_STOP_EVENT.set()
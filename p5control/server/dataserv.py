@@ -1,13 +1,14 @@
+import pickle
+import socket
 import threading
 import logging
 from pathlib import Path
 
-from rpyc.utils.classic import obtain
 from rpyc import ThreadedServer
 
 from ..settings import DATASERV_DEFAULT_PORT, DEFAULT_DATA_DIR
 from ..data import HDF5FileInterface, CallbackController
-from ..util import new_filename_generator
+from ..util import new_filename_generator, maybe_obtain
 from .baseserv import BaseServer, BaseServerError
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,9 @@ class DataServer(BaseServer):
                 'allow_pickle': True,
             },
         )
+        # accepted connections inherit TCP_NODELAY, the replies are then not held back by Nagle's
+        # algorithm waiting for the client to acknowledge the previous one
+        self._rpyc_server.listener.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self._rpyc_server.start()
         # start is blocking, set the event when the server has closed
         self.RPYC_SERVER_STOP_EVENT.set()
@@ -91,10 +95,24 @@ class DataServer(BaseServer):
     def append(self, path, arr, **kwargs):
         # copy array to the local machine
         logger.debug('obtaining array for path "%s"', path)
-        arr = obtain(arr)
+        arr = maybe_obtain(arr)
         
         return self._handler.append(path, arr, **kwargs)
 
+    def append_many(self, data):
+        # copy all arrays to the local machine at once
+        logger.debug('obtaining arrays for %d paths', len(data))
+        data = maybe_obtain(data)
+
+        return self._handler.append_many(data)
+
+    def get_data_pickled(self, path, indices = (), field = None):
+        """``get_data``, but returns the result already pickled. The bytes are sent to the client
+        directly, instead of as a netref which the client has to ask to pickle itself with an
+        additional request."""
+        data = self._handler.get_data(path, indices, field)
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
     @property
     def filename(self):
         return self._filename
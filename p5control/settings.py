@@ -18,6 +18,56 @@ STATUS_MEASUREMENT_BASE_PATH = "/status"
 CALLBACK_THREAD_COUNT = 5
 """The amount of threads in the thread pool responsible for callbacks."""
 
+DRIVER_SAVE_QUEUE_SIZE = 100
+"""Maximum amount of results of ``get_data`` a measuring driver keeps while they are being saved.
+If the data server falls behind, reading the device waits until there is space again."""
+
+CALLBACK_MAX_PENDING = 1000
+"""Maximum amount of callback events waiting for the thread pool. Further events are dropped
+until the pool catches up, such that stalled callbacks can not use up all memory."""
+
+HDF5_FLUSH_INTERVAL = 0.1
+"""Maximum time in seconds rows appended to an existing dataset are buffered before they are
+written to the hdf5 file."""
+
+HDF5_BUFFER_SIZE = 64 * 1024
+"""Amount of bytes of rows buffered for a dataset after which they are written to the hdf5 file,
+even if ``HDF5_FLUSH_INTERVAL`` has not passed yet."""
+
+HDF5_CHUNK_SIZE = 64 * 1024
+"""Targeted size in bytes of a chunk of datasets with an extendable first axis. The chunks span
+as many rows as fit into this size."""
+
+HDF5_PREALLOCATE_CHUNKS = 0
+"""Amount of chunks by which datasets grow at once, spare rows are removed when the file is
+closed. Disabled by default, since the spare rows are visible to anyone reading the shape of a
+dataset directly."""
+
+HDF5_CREATED_ON_STRING = True
+"""Whether datasets get a human readable ``created_on`` attribute in addition to the
+``created_on_ns`` timestamp in nanoseconds since the epoch."""
+
+HDF5_CHUNK_CACHE_SIZE = 64 * HDF5_CHUNK_SIZE
+"""Size in bytes of the raw data chunk cache of each dataset in the hdf5 file. Every opened
+dataset has its own cache, appending only needs the last chunk to stay in memory."""
+
+HDF5_CHUNK_CACHE_SLOTS = 10007
+"""Number of slots in the hash table of the chunk cache. Should be a prime, ideally about 100
+times the number of chunks which fit into ``HDF5_CHUNK_CACHE_SIZE``."""
+
+HDF5_CHUNK_CACHE_W0 = 1.0
+"""Preemption policy of the chunk cache, between 0 and 1. With 1, chunks which have been written
+completely are evicted first, which suits datasets that are only appended to."""
+
+HDF5_PAGE_SIZE = max(1024 * 1024, 2 * HDF5_CHUNK_SIZE)
+"""Size in bytes of the pages in which space is allocated in newly created hdf5 files, larger
+than ``HDF5_CHUNK_SIZE`` such that a chunk never spans two pages. Set to 0 to create files
+without paged allocation."""
+
+HDF5_PAGE_BUFFER_SIZE = 16 * 1024 * 1024
+"""Size in bytes of the page buffer, which collects small writes to files with paged allocation
+into writes of whole pages."""
+
 GATEWAY_ADDRESS = "localhost"
 """Address"""
 
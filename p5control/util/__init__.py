@@ -1,3 +1,4 @@
 from .filenames import new_filename_generator, name_generator
 from .colors import color_cycler
 from .asyncutil import wait
+from .rpycutil import maybe_obtain
@@ -0,0 +1,16 @@
+from rpyc.core.netref import BaseNetref
+from rpyc.utils.classic import obtain
+
+def maybe_obtain(obj):
+    """
+    Like `rpyc.utils.classic.obtain`, but returns `obj` itself if it is not a netref. `obtain`
+    pickles and unpickles any object, which copies objects that are already local.
+
+    Parameters
+    ----------
+    obj
+        netref or local object
+    """
+    if isinstance(obj, BaseNetref):
+        return obtain(obj)
+    return obj